@@ -11,12 +11,38 @@ Usage:
     manage_skills.py installed --project PATH
     manage_skills.py install SKILL_NAME --project PATH [--skills-root PATH]
     manage_skills.py uninstall SKILL_NAME --project PATH
+
+Requires pyyaml. If libyaml is available, its C loader is used for
+frontmatter parsing, which is much faster on trees with many skills.
 """
 
 import argparse
+import collections
+import concurrent.futures
+import functools
+import json
 import os
+import stat
 import sys
-import yaml
+import tempfile
+
+# PyYAML is imported lazily: it is the heaviest import in this module and
+# only the frontmatter fallback path needs it, so commands like
+# 'installed' and 'uninstall' never pay for it.
+_yaml = None
+_SafeLoader = None
+
+
+def _load_yaml():
+    """Import PyYAML on first use, preferring the libyaml C loader."""
+    global _yaml, _SafeLoader
+    if _yaml is None:
+        import yaml as _yaml
+        try:
+            from yaml import CSafeLoader as _SafeLoader
+        except ImportError:
+            from yaml import SafeLoader as _SafeLoader
+    return _yaml
 
 
 DEFAULT_SKILLS_ROOT = os.path.expanduser(
@@ -26,6 +52,9 @@ DEFAULT_SKILLS_ROOT = os.path.expanduser(
 SKIP_DIRS = {".git", "node_modules", "__pycache__", "template", "spec", ".claude-plugin"}
 SKIP_SKILL_NAMES = {"template"}
 
+# Cached discovery index, keyed by skills-root/provider mtimes
+CACHE_PATH = os.path.expanduser("~/.cache/skill-installer/index.json")
+
 # All target directories where skill symlinks are installed
 SKILL_TARGET_DIRS = [
     os.path.join(".claude", "skills"),
@@ -34,87 +63,282 @@ SKILL_TARGET_DIRS = [
 ]
 
 
-def parse_frontmatter(skill_md_path):
-    """Extract YAML frontmatter from a SKILL.md file."""
+# The only two frontmatter keys we consume, as bytes-level line anchors.
+_FM_ANCHORS = (("name", b"\nname:"), ("description", b"\ndescription:"))
+
+# Frontmatter is short; read it in 4 KB chunks and give up at 64 KB
+# rather than slurping a whole multi-KB SKILL.md body.
+_FM_READ_SIZE = 4096
+_FM_MAX_SIZE = 65536
+
+
+def _frontmatter_fallback(header_bytes):
+    """Parse a frontmatter block with the real YAML loader."""
+    yaml = _load_yaml()
     try:
-        with open(skill_md_path, "r") as f:
-            content = f.read()
-    except (OSError, IOError):
+        return yaml.load(header_bytes.decode("utf-8", "replace"),
+                         Loader=_SafeLoader)
+    except yaml.YAMLError:
         return None
 
-    if not content.startswith("---"):
+
+def parse_frontmatter(skill_md_path):
+    """Extract YAML frontmatter from a SKILL.md file.
+
+    Only the top-level ``name`` and ``description`` keys are consumed, so
+    the common case is a bytes-level scan: locate the closing delimiter
+    and the two key anchors with bytes.find and decode just the captured
+    values — no regex engine, no YAML parse, no unicode decode of the
+    uninteresting lines. Block scalars and continuation lines (rare in
+    SKILL.md) fall back to the real YAML loader.
+    """
+    try:
+        with open(skill_md_path, "rb") as f:
+            buf = f.read(_FM_READ_SIZE)
+            if not buf.startswith(b"---"):
+                return None
+            end = buf.find(b"\n---", 3)
+            while end == -1 and len(buf) < _FM_MAX_SIZE:
+                chunk = f.read(_FM_READ_SIZE)
+                if not chunk:
+                    break
+                buf += chunk
+                end = buf.find(b"\n---", 3)
+    except (OSError, IOError):
         return None
 
-    end = content.find("---", 3)
     if end == -1:
         return None
 
+    result = {}
+    for key, anchor in _FM_ANCHORS:
+        pos = buf.find(anchor, 3, end)
+        if pos == -1:
+            continue
+        value_start = pos + len(anchor)
+        line_end = buf.find(b"\n", value_start, end + 1)
+        if line_end == -1:
+            line_end = end
+        if buf[line_end + 1:line_end + 2] in (b" ", b"\t"):
+            # Continuation of a multi-line value: punt to the YAML parser.
+            return _frontmatter_fallback(buf[3:end + 1])
+        value = buf[value_start:line_end].decode("utf-8", "replace").strip()
+        if value[:1] in ("|", ">"):
+            # Block scalar: punt to the YAML parser.
+            return _frontmatter_fallback(buf[3:end + 1])
+        result[key] = value.strip('"').strip("'")
+
+    return result
+
+
+def _scan(provider_path):
+    """Yield directories under provider_path containing a SKILL.md file.
+
+    Hand-rolled os.scandir recursion instead of os.walk: DirEntry.is_dir()
+    is answered from the readdir d_type on Linux, so classifying entries
+    needs no extra stat() calls. Directories named in SKIP_DIRS are pruned.
+    """
+    subdirs = []
+    has_skill_md = False
     try:
-        return yaml.safe_load(content[3:end])
-    except yaml.YAMLError:
+        with os.scandir(provider_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name == "SKILL.md" and entry.is_file():
+                    has_skill_md = True
+    except OSError:
+        return
+    if has_skill_md:
+        yield provider_path
+    for subdir in subdirs:
+        yield from _scan(subdir)
+
+
+def _cache_fingerprint(skills_root):
+    """Return a list of [path, mtime_ns] pairs for the root and provider dirs.
+
+    Used to decide whether the cached index is still valid. Returns None
+    if the skills root cannot be statted.
+    """
+    try:
+        fingerprint = [[skills_root, os.stat(skills_root).st_mtime_ns]]
+        for provider in sorted(os.listdir(skills_root)):
+            provider_path = os.path.join(skills_root, provider)
+            if not os.path.isdir(provider_path) or provider.startswith("."):
+                continue
+            fingerprint.append([provider_path, os.stat(provider_path).st_mtime_ns])
+    except OSError:
         return None
+    return fingerprint
 
 
-def discover_skills(skills_root):
-    """Walk the skills root directory and find all available skills.
+def _read_cache(fingerprint):
+    """Return the cached skill list if its fingerprint matches, else None."""
+    try:
+        with open(CACHE_PATH, "r") as f:
+            data = json.load(f)
+    except (OSError, IOError, ValueError):
+        return None
+    if data.get("fingerprint") != fingerprint:
+        return None
+    return data.get("skills")
 
-    Returns a list of dicts: {name, description, provider, path, category}
+
+def _write_cache(fingerprint, skills):
+    """Atomically write the discovery index; failures are non-fatal."""
+    try:
+        cache_dir = os.path.dirname(CACHE_PATH)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"fingerprint": fingerprint, "skills": skills}, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+
+def discover_skills(skills_root, use_cache=True, refresh=False,
+                    provider_filter=None):
+    """Find all available skills, using the cached index when fresh.
+
+    The cache is keyed on the mtimes of the skills root and its provider
+    directories; any change there invalidates it. Pass use_cache=False to
+    bypass the cache entirely, or refresh=True to force a re-walk and
+    rewrite it. provider_filter restricts the walk to a single provider
+    directory; filtered walks skip the cache, which always indexes the
+    full tree.
     """
-    skills = []
-    seen = set()
+    if provider_filter is not None:
+        return _discover_skills(skills_root, provider_filter=provider_filter)
 
-    for provider in sorted(os.listdir(skills_root)):
-        provider_path = os.path.join(skills_root, provider)
-        if not os.path.isdir(provider_path) or provider.startswith("."):
-            continue
+    if not use_cache:
+        return _discover_skills(skills_root)
 
-        for root, dirs, files in os.walk(provider_path):
-            # Prune directories we don't want to descend into
-            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    fingerprint = _cache_fingerprint(skills_root)
+    if fingerprint is None:
+        return _discover_skills(skills_root)
 
-            if "SKILL.md" not in files:
-                continue
+    if not refresh:
+        cached = _read_cache(fingerprint)
+        if cached is not None:
+            return cached
 
-            skill_dir = root
-            skill_name = os.path.basename(skill_dir)
+    skills = _discover_skills(skills_root)
+    _write_cache(fingerprint, skills)
+    return skills
 
-            if skill_name in SKIP_SKILL_NAMES:
-                continue
 
-            # Deduplicate by (provider, skill_name)
-            key = (provider, skill_name)
+def _walk_provider(provider, provider_path):
+    """Collect skill records for a single provider directory."""
+    records = []
+    # Hot path: build paths with f-strings instead of os.path.join, which
+    # pays for fspath conversion and separator checks on every call. We
+    # control both operands, so plain concatenation is safe here.
+    sep = os.sep
+
+    for skill_dir in _scan(provider_path):
+        skill_name = os.path.basename(skill_dir)
+
+        if skill_name in SKIP_SKILL_NAMES:
+            continue
+
+        frontmatter = parse_frontmatter(f"{skill_dir}{sep}SKILL.md")
+        name = frontmatter.get("name", skill_name) if frontmatter else skill_name
+        description = ""
+        if frontmatter:
+            desc = frontmatter.get("description", "")
+            # Clean up quoted descriptions
+            if isinstance(desc, str):
+                description = desc.strip().strip('"').strip("'")
+
+        # Determine category from path (e.g., .curated, .system)
+        rel = os.path.relpath(skill_dir, provider_path)
+        parts = rel.split(sep)
+        category = None
+        for p in parts:
+            if p.startswith("."):
+                category = p.lstrip(".")
+                break
+
+        records.append({
+            "name": name,
+            "dir_name": skill_name,
+            "description": description,
+            "provider": provider,
+            "path": skill_dir,
+            "category": category,
+        })
+
+    return records
+
+
+def _discover_skills(skills_root, provider_filter=None):
+    """Walk the skills root directory and find all available skills.
+
+    Providers are walked in parallel threads: the work is readdir/stat
+    syscalls and small-file reads, all of which release the GIL.
+
+    Returns a list of dicts: {name, description, provider, path, category},
+    sorted by (provider, name) so consumers need not re-sort.
+    """
+    sep = os.sep
+    providers = []
+    for provider in sorted(os.listdir(skills_root)):
+        if provider_filter is not None and provider != provider_filter:
+            continue
+        provider_path = f"{skills_root}{sep}{provider}"
+        if os.path.isdir(provider_path) and not provider.startswith("."):
+            providers.append((provider, provider_path))
+
+    if len(providers) <= 1:
+        results = [_walk_provider(p, path) for p, path in providers]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(providers))) as ex:
+            results = list(ex.map(lambda args: _walk_provider(*args), providers))
+
+    # Deduplicate by (provider, dir_name); ex.map preserves provider
+    # order, so results are deterministic.
+    skills = []
+    seen = set()
+    for records in results:
+        for record in records:
+            key = (record["provider"], record["dir_name"])
             if key in seen:
                 continue
             seen.add(key)
+            skills.append(record)
 
-            frontmatter = parse_frontmatter(os.path.join(skill_dir, "SKILL.md"))
-            name = frontmatter.get("name", skill_name) if frontmatter else skill_name
-            description = ""
-            if frontmatter:
-                desc = frontmatter.get("description", "")
-                # Clean up quoted descriptions
-                if isinstance(desc, str):
-                    description = desc.strip().strip('"').strip("'")
-
-            # Determine category from path (e.g., .curated, .system)
-            rel = os.path.relpath(skill_dir, provider_path)
-            parts = rel.split(os.sep)
-            category = None
-            for p in parts:
-                if p.startswith("."):
-                    category = p.lstrip(".")
-                    break
+    skills.sort(key=lambda s: (s["provider"], s["name"]))
+    return skills
 
-            skills.append({
-                "name": name,
-                "dir_name": skill_name,
-                "description": description,
-                "provider": provider,
-                "path": skill_dir,
-                "category": category,
-            })
 
-    return skills
+@functools.lru_cache(maxsize=128)
+def _cached_readlink(path):
+    """os.readlink memoized for the process lifetime.
+
+    Links are immutable within a single invocation except through our own
+    symlink/unlink calls, which clear the cache.
+    """
+    return os.readlink(path)
+
+
+def _link_state(path):
+    """Return (exists, is_link, target) for path using a single lstat.
+
+    target is the symlink destination, or None when path is absent or not
+    a symlink. Replaces separate exists/islink/readlink checks, each of
+    which costs its own syscall.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return (False, False, None)
+    is_link = stat.S_ISLNK(st.st_mode)
+    target = _cached_readlink(path) if is_link else None
+    return (True, is_link, target)
 
 
 def get_project_skills_dirs(project_path):
@@ -130,23 +354,28 @@ def get_installed_skills(project_path):
     """
     installed = {}
     for skills_dir in get_project_skills_dirs(project_path):
-        if not os.path.isdir(skills_dir):
+        try:
+            with os.scandir(skills_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
             continue
-        for entry in sorted(os.listdir(skills_dir)):
-            entry_path = os.path.join(skills_dir, entry)
-            if entry.startswith("."):
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in installed:
                 continue
-            if os.path.isdir(entry_path) and entry not in installed:
-                if os.path.islink(entry_path):
-                    installed[entry] = os.readlink(entry_path)
-                else:
-                    installed[entry] = None
+            # DirEntry answers is_symlink/is_dir from cached lstat data,
+            # so only confirmed symlinks cost an extra readlink syscall.
+            if entry.is_symlink():
+                if entry.is_dir():
+                    installed[entry.name] = _cached_readlink(entry.path)
+            elif entry.is_dir(follow_symlinks=False):
+                installed[entry.name] = None
     return installed
 
 
 def cmd_list(args):
     """List all available skills grouped by provider."""
-    skills = discover_skills(args.skills_root)
+    skills = discover_skills(args.skills_root, use_cache=not args.no_cache,
+                             refresh=args.refresh)
     if not skills:
         print("No skills found in", args.skills_root)
         return
@@ -156,15 +385,18 @@ def cmd_list(args):
     if args.project:
         installed = get_installed_skills(args.project)
 
-    # Group by provider
-    by_provider = {}
+    # Group by provider; discover_skills returns records sorted by
+    # (provider, name), so insertion order is already display order.
+    by_provider = collections.defaultdict(list)
     for s in skills:
-        by_provider.setdefault(s["provider"], []).append(s)
-
-    for provider in sorted(by_provider.keys()):
-        provider_skills = by_provider[provider]
-        print(f"\n## {provider}")
-        for i, s in enumerate(sorted(provider_skills, key=lambda x: x["name"]), 1):
+        by_provider[s["provider"]].append(s)
+
+    # Buffer output and emit it with a single write rather than paying
+    # the stdout lock/flush per print on trees with hundreds of skills.
+    out = []
+    for provider, provider_skills in by_provider.items():
+        out.append(f"\n## {provider}\n")
+        for i, s in enumerate(provider_skills, 1):
             status = ""
             if s["dir_name"] in installed or s["name"] in installed:
                 status = " (installed)"
@@ -173,11 +405,12 @@ def cmd_list(args):
             desc = s["description"]
             if len(desc) > 120:
                 desc = desc[:117] + "..."
-            print(f"  {i}. {s['name']}{cat}{status}")
+            out.append(f"  {i}. {s['name']}{cat}{status}\n")
             if desc:
-                print(f"     {desc}")
+                out.append(f"     {desc}\n")
 
-    print(f"\nTotal: {len(skills)} skills from {len(by_provider)} providers")
+    out.append(f"\nTotal: {len(skills)} skills from {len(by_provider)} providers\n")
+    sys.stdout.write("".join(out))
 
 
 def cmd_installed(args):
@@ -187,24 +420,37 @@ def cmd_installed(args):
         print(f"No skills installed for project at {args.project}")
         return
 
-    print(f"Installed skills for {args.project}:\n")
+    out = [f"Installed skills for {args.project}:\n\n"]
     for name, target in sorted(installed.items()):
         if target:
-            print(f"  - {name} -> {target}")
+            out.append(f"  - {name} -> {target}\n")
         else:
-            print(f"  - {name} (local copy, not symlinked)")
+            out.append(f"  - {name} (local copy, not symlinked)\n")
+    sys.stdout.write("".join(out))
 
 
 def cmd_install(args):
     """Install a skill by creating a symlink."""
-    skills = discover_skills(args.skills_root)
+    skills = discover_skills(args.skills_root, use_cache=not args.no_cache,
+                             refresh=args.refresh,
+                             provider_filter=args.provider)
+
+    # Index once by both frontmatter name and directory name so lookups
+    # are O(1) regardless of tree size.
+    name_index = {}
+    for s in skills:
+        name_index.setdefault(s["name"], []).append(s)
+        if s["dir_name"] != s["name"]:
+            name_index.setdefault(s["dir_name"], []).append(s)
 
-    # Find matching skill(s)
-    matches = [s for s in skills if s["name"] == args.skill_name or s["dir_name"] == args.skill_name]
+    matches = name_index.get(args.skill_name, [])
 
     if not matches:
-        print(f"Error: Skill '{args.skill_name}' not found.")
-        print("Run with 'list' to see available skills.")
+        if args.provider:
+            print(f"Error: Skill '{args.skill_name}' not found from provider '{args.provider}'.")
+        else:
+            print(f"Error: Skill '{args.skill_name}' not found.")
+            print("Run with 'list' to see available skills.")
         sys.exit(1)
 
     if len(matches) > 1 and not args.provider:
@@ -227,29 +473,31 @@ def cmd_install(args):
     # Check if already installed in any target directory
     for skills_dir in skills_dirs:
         link_path = os.path.join(skills_dir, skill["dir_name"])
-        if os.path.exists(link_path):
-            if os.path.islink(link_path):
-                current_target = os.readlink(link_path)
-                if current_target == skill["path"]:
-                    continue  # Already correct in this dir
-                else:
-                    print(f"Skill '{skill['name']}' is already installed in {skills_dir} but points to a different location:")
-                    print(f"  Current: {current_target}")
-                    print(f"  New:     {skill['path']}")
-                    print("Remove the existing link first with 'uninstall'.")
-                    sys.exit(1)
-            else:
-                print(f"Error: '{link_path}' exists and is not a symlink. Remove it manually if you want to replace it.")
-                sys.exit(1)
+        exists, is_link, current_target = _link_state(link_path)
+        if not exists:
+            continue
+        if is_link:
+            if current_target == skill["path"]:
+                continue  # Already correct in this dir
+            print(f"Skill '{skill['name']}' is already installed in {skills_dir} but points to a different location:")
+            print(f"  Current: {current_target}")
+            print(f"  New:     {skill['path']}")
+            print("Remove the existing link first with 'uninstall'.")
+            sys.exit(1)
+        else:
+            print(f"Error: '{link_path}' exists and is not a symlink. Remove it manually if you want to replace it.")
+            sys.exit(1)
 
     # Create symlinks in all target directories
     created = []
     for skills_dir in skills_dirs:
         link_path = os.path.join(skills_dir, skill["dir_name"])
-        if os.path.islink(link_path) and os.readlink(link_path) == skill["path"]:
+        _, is_link, current_target = _link_state(link_path)
+        if is_link and current_target == skill["path"]:
             continue  # Already correct
         os.makedirs(skills_dir, exist_ok=True)
         os.symlink(skill["path"], link_path)
+        _cached_readlink.cache_clear()
         created.append(link_path)
 
     print(f"Installed '{skill['name']}' from {skill['provider']}")
@@ -265,13 +513,14 @@ def cmd_uninstall(args):
 
     for skills_dir in skills_dirs:
         link_path = os.path.join(skills_dir, args.skill_name)
-        if not os.path.exists(link_path) and not os.path.islink(link_path):
+        exists, is_link, target = _link_state(link_path)
+        if not exists:
             continue
-        if not os.path.islink(link_path):
+        if not is_link:
             errors.append(f"  '{link_path}' is not a symlink (local copy). Remove manually: rm -rf {link_path}")
             continue
-        target = os.readlink(link_path)
         os.unlink(link_path)
+        _cached_readlink.cache_clear()
         removed.append(f"  {link_path} -> {target}")
 
     if not removed and not errors:
@@ -288,7 +537,18 @@ def cmd_uninstall(args):
             print(e)
 
 
-def main():
+def main(argv=None, target_dirs=None):
+    """CLI entry point.
+
+    A variant script with a different set of install directories can be a
+    thin wrapper (``from manage_skills import main; main(target_dirs=[...])``)
+    instead of carrying its own copy of this module. target_dirs defaults
+    to SKILL_TARGET_DIRS.
+    """
+    global SKILL_TARGET_DIRS
+    if target_dirs is not None:
+        SKILL_TARGET_DIRS = list(target_dirs)
+
     parser = argparse.ArgumentParser(description="Manage Claude Code skill installation via symlinks")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -298,6 +558,10 @@ def main():
                         help="Root directory containing provider skill directories")
         p.add_argument("--project", default=None,
                         help="Project directory (defaults to current working directory)")
+        p.add_argument("--no-cache", action="store_true",
+                        help="Bypass the cached skill index")
+        p.add_argument("--refresh", action="store_true",
+                        help="Force a re-walk and rewrite the cached skill index")
 
     # list
     list_parser = subparsers.add_parser("list", help="List available skills")
@@ -322,7 +586,7 @@ def main():
     add_common_args(uninstall_parser)
     uninstall_parser.set_defaults(func=cmd_uninstall)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Default project to cwd if not specified
     if args.project is None: